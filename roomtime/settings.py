@@ -54,6 +54,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -93,6 +94,8 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
         'HOST': os.getenv('POSTGRES_HOST'),
         'PORT': os.getenv('POSTGRES_PORT'),
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE') or 60),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -102,6 +105,20 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 
+REDIS_POOL_SIZE = int(os.getenv('REDIS_POOL_SIZE') or 50)
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'max_connections': REDIS_POOL_SIZE,
+    'socket_keepalive': True,
+    'socket_connect_timeout': 2,
+    'health_check_interval': 30,
+    'retry_on_timeout': True,
+}
+CELERY_REDIS_MAX_CONNECTIONS = REDIS_POOL_SIZE
+CELERY_REDIS_SOCKET_KEEPALIVE = True
+CELERY_REDIS_SOCKET_CONNECT_TIMEOUT = 2
+CELERY_REDIS_BACKEND_HEALTH_CHECK_INTERVAL = 30
+CELERY_REDIS_RETRY_ON_TIMEOUT = True
+
 
 
 # Password validation